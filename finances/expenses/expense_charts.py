@@ -1,9 +1,21 @@
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
 import pandas as pd
 
 
+_PROP_CYCLE_COLORS = plt.rcParams["axes.prop_cycle"].by_key().get("color", ["skyblue", "C1", "C2", "C3", "C4", "C5", "C6", "C7"])
+
+
+@lru_cache(maxsize=8)
+def _color_map_for(categories):
+    return {cat: _PROP_CYCLE_COLORS[i % len(_PROP_CYCLE_COLORS)] for i, cat in enumerate(categories)}
+
+
 def create_category_color_map(df):
     expense_categories_all = df['category'] if 'category' in df.columns else None
     if expense_categories_all is not None:
@@ -11,21 +23,80 @@ def create_category_color_map(df):
         unique_categories_all = sorted(unique_categories_all)
     else:
         unique_categories_all = []
-    available_colors = plt.rcParams["axes.prop_cycle"].by_key().get("color", ["skyblue", "C1", "C2", "C3", "C4", "C5", "C6", "C7"])
-    return {cat: available_colors[i % len(available_colors)] for i, cat in enumerate(unique_categories_all)}
+    return _color_map_for(tuple(unique_categories_all))
+
+
+@dataclass
+class _WaterfallContext:
+    color_map: dict
+    names: np.ndarray
+    values: np.ndarray
+    categories: np.ndarray
+    category_names: np.ndarray
+    category_values: np.ndarray
+
+
+_prepare_cache = {}
+
+
+def _prepare(df):
+    value_col = 'monthly_value_eur' if 'monthly_value_eur' in df.columns else 'monthly_value'
+    fingerprint = float(df[value_col].sum()) if len(df) else 0.0
+    key = (id(df), df.shape[0], fingerprint)
+    entry = _prepare_cache.get(key)
+    if entry is not None:
+        frame_ref, ctx = entry
+        if frame_ref() is df:
+            return ctx
+
+    color_map = create_category_color_map(df)
+
+    df_sorted = df.sort_values(value_col)
+    names = df_sorted['name'].to_numpy()
+    values = df_sorted[value_col].to_numpy()
+    categories = df_sorted['category'].to_numpy() if 'category' in df.columns else np.array(["Other"] * len(names))
+
+    if 'category' in df.columns:
+        category_sums = df[value_col].groupby(df['category']).sum()
+        category_sums = category_sums[category_sums.index.notnull()]
+        category_sums = category_sums.sort_values()
+        category_names = category_sums.index.to_numpy()
+        category_values = category_sums.to_numpy()
+    else:
+        category_names = np.array([])
+        category_values = np.array([])
 
+    ctx = _WaterfallContext(color_map, names, values, categories, category_names, category_values)
+    if len(_prepare_cache) >= 8:
+        _prepare_cache.clear()
+    _prepare_cache[key] = (weakref.ref(df), ctx)
+    return ctx
 
-def plot_expenses_waterfall(df):
-    category_color_map = create_category_color_map(df)
-    
-    expense_values = df['monthly_value_eur'] if 'monthly_value_eur' in df.columns else df['monthly_value']
-    expense_names = df['name']
-    expense_categories = df['category'] if 'category' in df.columns else None
 
-    sorted_indices = np.argsort(expense_values.values)
-    expense_names_sorted = expense_names.values[sorted_indices]
-    expense_values_sorted = expense_values.values[sorted_indices]
-    expense_categories_sorted = expense_categories.values[sorted_indices] if expense_categories is not None else ["Other"] * len(expense_names_sorted)
+def _blit_waterfall(fig, ax, bars, label_texts):
+    """Redraw only the bars and labels when *ax* is reused in an interactive loop."""
+    artists = (*bars, *label_texts)
+    for artist in artists:
+        artist.set_animated(True)
+
+    background = getattr(ax, '_waterfall_background', None)
+    if background is None or getattr(ax, '_waterfall_bar_count', None) != len(bars):
+        fig.canvas.draw()
+        ax._waterfall_background = fig.canvas.copy_from_bbox(ax.bbox)
+        ax._waterfall_bar_count = len(bars)
+
+    fig.canvas.restore_region(ax._waterfall_background)
+    for artist in artists:
+        ax.draw_artist(artist)
+    fig.canvas.blit(ax.bbox)
+
+
+def plot_expenses_waterfall(df, ax=None):
+    ctx = _prepare(df)
+    category_color_map = ctx.color_map
+    expense_names_sorted = ctx.names
+    expense_values_sorted = ctx.values
+    expense_categories_sorted = ctx.categories
 
     cumulative = np.cumsum(expense_values_sorted) - expense_values_sorted
 
@@ -35,33 +106,24 @@ def plot_expenses_waterfall(df):
     else:
         insert_at = rent_idx[0] + 1
 
-    all_names = list(expense_names_sorted)
-    all_values = list(expense_values_sorted)
-    all_cumulative = list(cumulative)
-    all_categories = list(expense_categories_sorted)
-
-    all_names.insert(insert_at, "TOTAL")
-    all_values.insert(insert_at, expense_values_sorted.sum())
-    all_cumulative.insert(insert_at, 0)
-    all_categories.insert(insert_at, "Total")
+    all_names = np.insert(expense_names_sorted, insert_at, "TOTAL")
+    all_values = np.insert(expense_values_sorted, insert_at, expense_values_sorted.sum())
+    all_cumulative = np.insert(cumulative, insert_at, 0)
+    all_categories = np.insert(expense_categories_sorted, insert_at, "Total")
 
     total_value = expense_values_sorted.sum()
 
-    bar_colors = []
-    for i, cat in enumerate(all_categories):
-        if i == insert_at:
-            bar_colors.append("orange")
-        else:
-            bar_colors.append(category_color_map.get(cat, "grey"))
-
-    label_colors = []
-    for i, cat in enumerate(all_categories):
-        if i == insert_at:
-            label_colors.append("orange")
-        else:
-            label_colors.append(category_color_map.get(cat, "grey"))
+    bar_colors = [category_color_map.get(cat, "grey") for cat in all_categories]
+    bar_colors[insert_at] = "orange"
+    label_colors = bar_colors
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    owns_figure = ax is None
+    if owns_figure:
+        fig, ax = plt.subplots(figsize=(10, 6))
+    else:
+        fig = ax.figure
+        for artist in getattr(ax, '_waterfall_artists', ()):
+            artist.remove()
 
     bars = ax.barh(all_names, all_values, left=all_cumulative, color=bar_colors)
 
@@ -69,17 +131,15 @@ def plot_expenses_waterfall(df):
     ax.set_ylabel('Expense Name')
     ax.set_title('Monthly Expenses Waterfall (EUR)')
 
-    for i, (bar, value, label_color) in enumerate(zip(bars, all_values, label_colors)):
-        percent = int(round(100 * value / total_value)) if total_value > 0 else 0
-        label_text = f'{int(round(value))} - {percent}%'
-        if i == insert_at:
-            ax.text(bar.get_x() + bar.get_width() + 0.05,
-                    bar.get_y() + bar.get_height() / 2,
-                    label_text, va='center', ha='left', fontweight='bold')
-        else:
-            ax.text(bar.get_x() + bar.get_width() + 0.05,
-                    bar.get_y() + bar.get_height() / 2,
-                    label_text, va='center', ha='left')
+    rounded_values = np.round(all_values).astype(np.int64)
+    rounded_percents = (
+        np.round(100 * all_values / total_value).astype(np.int64)
+        if total_value > 0
+        else np.zeros(len(all_values), dtype=np.int64)
+    )
+    labels = [f"{value} - {percent}%" for value, percent in zip(rounded_values, rounded_percents)]
+    label_texts = ax.bar_label(bars, labels=labels, padding=3)
+    label_texts[insert_at].set_fontweight('bold')
 
     yticks = ax.get_yticklabels()
     for i, tick in enumerate(yticks):
@@ -91,23 +151,19 @@ def plot_expenses_waterfall(df):
 
     ax.legend(handles=legend_handles, title="Categories", bbox_to_anchor=(0.98, 0.02), loc="lower right")
 
-    plt.tight_layout()
-    plt.show(fig)
-
-
-def plot_category_waterfall(df):
-    category_color_map = create_category_color_map(df)
-    
-    expense_values = df['monthly_value_eur'] if 'monthly_value_eur' in df.columns else df['monthly_value']
-    expense_categories = df['category']
-
-    category_sums = expense_values.groupby(expense_categories).sum()
+    if owns_figure:
+        plt.tight_layout()
+        plt.show(fig)
+    else:
+        ax._waterfall_artists = (*bars, *label_texts)
+        _blit_waterfall(fig, ax, bars, label_texts)
 
-    category_sums = category_sums[category_sums.index.notnull()]
 
-    sorted_indices = np.argsort(category_sums.values)
-    categories_sorted = category_sums.index.values[sorted_indices]
-    values_sorted = category_sums.values[sorted_indices]
+def plot_category_waterfall(df, ax=None):
+    ctx = _prepare(df)
+    category_color_map = ctx.color_map
+    categories_sorted = ctx.category_names
+    values_sorted = ctx.category_values
 
     cumulative = np.cumsum(values_sorted) - values_sorted
 
@@ -117,31 +173,23 @@ def plot_category_waterfall(df):
     else:
         insert_at = housing_idx[0] + 1
 
-    all_names = list(categories_sorted)
-    all_values = list(values_sorted)
-    all_cumulative = list(cumulative)
-
-    all_names.insert(insert_at, "TOTAL")
-    all_values.insert(insert_at, values_sorted.sum())
-    all_cumulative.insert(insert_at, 0)
+    all_names = np.insert(categories_sorted, insert_at, "TOTAL")
+    all_values = np.insert(values_sorted, insert_at, values_sorted.sum())
+    all_cumulative = np.insert(cumulative, insert_at, 0)
 
     total_value = values_sorted.sum()
 
-    bar_colors = []
-    for i, name in enumerate(all_names):
-        if i == insert_at:
-            bar_colors.append("orange")
-        else:
-            bar_colors.append(category_color_map.get(name, "grey"))
+    bar_colors = [category_color_map.get(name, "grey") for name in all_names]
+    bar_colors[insert_at] = "orange"
+    label_colors = bar_colors
 
-    label_colors = []
-    for i, name in enumerate(all_names):
-        if i == insert_at:
-            label_colors.append("orange")
-        else:
-            label_colors.append(category_color_map.get(name, "grey"))
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    owns_figure = ax is None
+    if owns_figure:
+        fig, ax = plt.subplots(figsize=(10, 6))
+    else:
+        fig = ax.figure
+        for artist in getattr(ax, '_waterfall_artists', ()):
+            artist.remove()
 
     bars = ax.barh(all_names, all_values, left=all_cumulative, color=bar_colors)
 
@@ -149,17 +197,15 @@ def plot_category_waterfall(df):
     ax.set_ylabel('Expense Category')
     ax.set_title('Monthly Expenses')
 
-    for i, (bar, value, label_color) in enumerate(zip(bars, all_values, label_colors)):
-        percent = int(round(100 * value / total_value)) if total_value > 0 else 0
-        label_text = f'{int(round(value))} - {percent}%'
-        if i == insert_at:
-            ax.text(bar.get_x() + bar.get_width() + 0.05,
-                    bar.get_y() + bar.get_height() / 2,
-                    label_text, va='center', ha='left', fontweight='bold')
-        else:
-            ax.text(bar.get_x() + bar.get_width() + 0.05,
-                    bar.get_y() + bar.get_height() / 2,
-                    label_text, va='center', ha='left')
+    rounded_values = np.round(all_values).astype(np.int64)
+    rounded_percents = (
+        np.round(100 * all_values / total_value).astype(np.int64)
+        if total_value > 0
+        else np.zeros(len(all_values), dtype=np.int64)
+    )
+    labels = [f"{value} - {percent}%" for value, percent in zip(rounded_values, rounded_percents)]
+    label_texts = ax.bar_label(bars, labels=labels, padding=3)
+    label_texts[insert_at].set_fontweight('bold')
 
     yticks = ax.get_yticklabels()
     for i, tick in enumerate(yticks):
@@ -171,6 +217,10 @@ def plot_category_waterfall(df):
 
     ax.legend(handles=legend_handles, title="Categories", bbox_to_anchor=(0.98, 0.02), loc="lower right")
 
-    plt.tight_layout()
-    plt.show(fig)
+    if owns_figure:
+        plt.tight_layout()
+        plt.show(fig)
+    else:
+        ax._waterfall_artists = (*bars, *label_texts)
+        _blit_waterfall(fig, ax, bars, label_texts)
 
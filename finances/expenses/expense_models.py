@@ -2,12 +2,20 @@
 
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from typing import Literal
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 
 def get_latest_expense_file(directory: Optional[Path] = None) -> Path:
     """Find the most recent expense file matching YYYY-MM-DD.json pattern."""
@@ -28,7 +36,7 @@ DEFAULT_REPEAT_EVERY: int = 1
 _VALID_REPEAT_UNITS = {"days", "weeks", "months", "years"}
 
 
-@dataclass
+@dataclass(slots=True)
 class Expense:
     account_id: str
     name: str
@@ -44,64 +52,231 @@ class Expense:
     yearly_value: Optional[float] = None
 
 
-def load_expenses(expense_file: str | Path, accounts_file: Optional[str | Path] = None) -> List[Expense]:
-    """Load expenses from *expense_file* and normalize them into Expense objects."""
+_EXPENSE_INPUT_COLUMNS = (
+    "account_id",
+    "name",
+    "description",
+    "category",
+    "value",
+    "currency",
+    "repeat_every_unit",
+)
+
+
+@lru_cache(maxsize=8)
+def _load_accounts(accounts_path: str) -> Dict:
+    """Parse *accounts_path* once; repeated loads reuse the cached dict."""
+    return json.loads(Path(accounts_path).read_text(encoding="utf-8"))
+
+
+def _load_expense_frame(expense_path: Path, accounts_path: Path) -> Any:
+    """Parse *expense_path* into a DataFrame with the derived value columns, in file order."""
+
+    pd = import_module("pandas")
+
+    if accounts_path.exists():
+        accounts = _load_accounts(str(accounts_path)).get("accounts", [])
+
+    with expense_path.open("r", encoding="utf-8") as fh:
+        raw_expenses = json.load(fh)
+
+    dataframe = pd.DataFrame(raw_expenses)
+
+    for column in _EXPENSE_INPUT_COLUMNS:
+        if column not in dataframe.columns:
+            dataframe[column] = None
+
+    if "repeat_every" not in dataframe.columns:
+        dataframe["repeat_every"] = DEFAULT_REPEAT_EVERY
+    else:
+        dataframe["repeat_every"] = (
+            dataframe["repeat_every"].fillna(DEFAULT_REPEAT_EVERY).astype("int64")
+        )
+
+    dataframe = dataframe.loc[:, list(_EXPENSE_INPUT_COLUMNS) + ["repeat_every"]]
+
+    if len(dataframe) == 0:
+        for column in ("monthly_value", "monthly_value_eur", "yearly_value", "yearly_value_eur"):
+            dataframe[column] = None
+        return dataframe
+
+    units = dataframe["repeat_every_unit"].to_numpy()
+    unit_codes = np.fromiter(
+        (_UNIT_CODE.get(unit, -1) for unit in units), dtype=np.int8, count=len(units)
+    )
+    if (unit_codes < 0).any():
+        raise KeyError(units[unit_codes < 0][0])
+
+    currencies = dataframe["currency"].fillna("EUR").to_numpy()
+    currency_codes = np.fromiter(
+        (_CURRENCY_CODE.get(currency, -1) for currency in currencies),
+        dtype=np.int8,
+        count=len(currencies),
+    )
+    if (currency_codes < 0).any():
+        raise ValueError(
+            f"Unsupported currency conversion: {currencies[currency_codes < 0][0]} -> EUR"
+        )
+
+    monthly, monthly_eur, yearly, yearly_eur = _normalized_value_arrays(
+        dataframe["value"].to_numpy(dtype=np.float64),
+        currency_codes,
+        dataframe["repeat_every"].to_numpy(dtype=np.float64),
+        unit_codes,
+    )
+    dataframe["monthly_value"] = monthly
+    dataframe["monthly_value_eur"] = monthly_eur
+    dataframe["yearly_value"] = yearly
+    dataframe["yearly_value_eur"] = yearly_eur
+
+    return dataframe
+
 
+def _resolve_paths(expense_file: str | Path, accounts_file: Optional[str | Path]) -> tuple:
     expense_path = Path(expense_file)
     accounts_path = (
         Path(accounts_file)
         if accounts_file is not None
         else expense_path.with_name("accounts.json")
     )
+    return expense_path, accounts_path
 
-    if accounts_path.exists():
-        with accounts_path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        accounts = data.get("accounts", [])
 
-    with expense_path.open("r", encoding="utf-8") as fh:
-        raw_expenses = json.load(fh)
+def load_expenses_dataframe(expense_file: str | Path, accounts_file: Optional[str | Path] = None) -> Any:
+    """Load expenses from *expense_file* straight into a presentation-ready DataFrame."""
 
-    expenses: List[Expense] = []
-
-    for raw in raw_expenses:
-        repeat_every = raw.get("repeat_every")
-        expense = Expense(
-                account_id=raw.get("account_id"),
-                name=raw.get("name"),
-                description=raw.get("description"),
-                category=raw.get("category"),
-                value=raw.get("value"),
-                currency=raw.get("currency"),
-                repeat_every_unit=raw.get("repeat_every_unit"),
-                repeat_every=repeat_every if repeat_every is not None else DEFAULT_REPEAT_EVERY,
-            )
+    expense_path, accounts_path = _resolve_paths(expense_file, accounts_file)
+    return _present_dataframe(_load_expense_frame(expense_path, accounts_path))
 
-        expense.monthly_value = normalize_value(expense, target_currency=None, target_time_unit="months")
-        expense.monthly_value_eur = normalize_value(expense, target_currency="EUR", target_time_unit="months")
-        expense.yearly_value = normalize_value(expense, target_currency=None, target_time_unit="years")
-        expense.yearly_value_eur = normalize_value(expense, target_currency="EUR", target_time_unit="years")
-        expenses.append(expense)
 
-    return expenses
+def load_expenses(expense_file: str | Path, accounts_file: Optional[str | Path] = None) -> List[Expense]:
+    """Load expenses from *expense_file* and normalize them into Expense objects."""
+
+    expense_path, accounts_path = _resolve_paths(expense_file, accounts_file)
+    dataframe = _load_expense_frame(expense_path, accounts_path)
+    dataframe = dataframe.astype(object).where(dataframe.notna(), None)
+
+    return [
+        Expense(
+            account_id=record.get("account_id"),
+            name=record.get("name"),
+            description=record.get("description"),
+            category=record.get("category"),
+            value=record.get("value"),
+            currency=record.get("currency"),
+            repeat_every_unit=record.get("repeat_every_unit"),
+            repeat_every=record.get("repeat_every", DEFAULT_REPEAT_EVERY),
+            monthly_value=record.get("monthly_value"),
+            monthly_value_eur=record.get("monthly_value_eur"),
+            yearly_value=record.get("yearly_value"),
+            yearly_value_eur=record.get("yearly_value_eur"),
+        )
+        for record in dataframe.to_dict("records")
+    ]
+
+def _normalized_value_arrays(
+    values: Any, currency_codes: Any, intervals: Any, unit_codes: Any
+) -> tuple:
+    """Vectorized equivalent of normalize_value for the four derived columns.
+
+    *currency_codes* and *unit_codes* are int8 indices into the sorted
+    _FX_CURRENCIES and _TIME_UNITS tables, produced at JSON load time.
+    """
+
+    return _normalize_kernel(
+        values,
+        intervals,
+        unit_codes,
+        currency_codes,
+        _DAYS_PER_TIME_UNIT,
+        _FX_RATES_TO_EUR,
+        _DAYS_PER_UNIT["months"],
+    )
+
+def _normalize_numpy(
+    values, intervals, unit_codes, currency_codes, days_per_unit, fx_to_eur, days_per_month
+):
+    days_per_interval = intervals * days_per_unit[unit_codes]
+    monthly = values * days_per_month / days_per_interval
+    fx = fx_to_eur[currency_codes]
+    return monthly, monthly * fx, monthly * 12, monthly * 12 * fx
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _normalize_kernel(
+        values, intervals, unit_codes, currency_codes, days_per_unit, fx_to_eur, days_per_month
+    ):
+        n = values.shape[0]
+        monthly = np.empty(n, dtype=np.float64)
+        monthly_eur = np.empty(n, dtype=np.float64)
+        yearly = np.empty(n, dtype=np.float64)
+        yearly_eur = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            days_per_interval = intervals[i] * days_per_unit[unit_codes[i]]
+            m = values[i] * days_per_month / days_per_interval
+            fx = fx_to_eur[currency_codes[i]]
+            monthly[i] = m
+            monthly_eur[i] = m * fx
+            yearly[i] = m * 12
+            yearly_eur[i] = m * 12 * fx
+        return monthly, monthly_eur, yearly, yearly_eur
+else:
+    _normalize_kernel = _normalize_numpy
 
 def normalize_value(expense: Expense, target_currency: Optional[str] = None, target_time_unit: Optional[Literal["days", "weeks", "months", "years"]] = None) -> float:
-    fx_rate = get_fx_rate(expense.currency, target_currency)
+    fx_rate = (
+        1.0
+        if target_currency is None or target_currency == expense.currency
+        else get_fx_rate(expense.currency, target_currency)
+    )
     time_factor = time_conversion_factor(expense.repeat_every, expense.repeat_every_unit, target_time_unit)
     return expense.value * fx_rate * time_factor
 
+def normalize_values(expense: Expense, target_currency: str = "EUR") -> tuple:
+    """Compute (monthly, monthly converted, yearly, yearly converted) in one pass.
+
+    Fused equivalent of four normalize_value calls: the FX rate and the
+    days-per-interval factor are each looked up once and shared.
+    """
+
+    days_per_interval = expense.repeat_every * _DAYS_PER_UNIT[expense.repeat_every_unit]
+    monthly = expense.value * _DAYS_PER_UNIT["months"] / days_per_interval
+    yearly = monthly * 12
+    fx_rate = get_fx_rate(expense.currency, target_currency)
+    return monthly, monthly * fx_rate, yearly, yearly * fx_rate
+
 def time_conversion_factor(interval: float, interval_unit: Literal["days", "weeks", "months", "years"], target_unit: Literal["days", "weeks", "months", "years"]) -> float:
     days_per_interval = interval * days_in_time_unit(interval_unit)
     days_per_target_unit = days_in_time_unit(target_unit)
     return days_per_target_unit / days_per_interval
 
+_DAYS_PER_UNIT = {
+    "days": 1,
+    "weeks": 7,
+    "months": 146097 / 400 / 12, # Gregorian mean year / 12
+    "years": 146097 / 400,       # Gregorian mean year
+}
+
+_TIME_UNITS = np.array(sorted(_DAYS_PER_UNIT))
+_DAYS_PER_TIME_UNIT = np.array([_DAYS_PER_UNIT[unit] for unit in _TIME_UNITS])
+_UNIT_CODE = {unit: code for code, unit in enumerate(sorted(_DAYS_PER_UNIT))}
+
 def days_in_time_unit(time_unit: Literal["days", "weeks", "months", "years"]) -> float:
-    return {
-        "days": 1,
-        "weeks": 7,
-        "months": 146097 / 400 / 12, # Gregorian mean year / 12
-        "years": 146097 / 400,       # Gregorian mean year
-    }[time_unit]
+    return _DAYS_PER_UNIT[time_unit]
+
+_RATES_TO_EUR = {
+    "EUR": 1.0,
+    "USD": 1 / 1.1570,
+    "BRL": 1 / 6.1690,
+}
+_FX_CURRENCIES = np.array(sorted(_RATES_TO_EUR))
+_FX_RATES_TO_EUR = np.array([_RATES_TO_EUR[currency] for currency in _FX_CURRENCIES])
+_CURRENCY_CODE = {currency: code for code, currency in enumerate(sorted(_RATES_TO_EUR))}
+_FX = {
+    (currency, target_currency): _RATES_TO_EUR[currency] / _RATES_TO_EUR[target_currency]
+    for currency in _RATES_TO_EUR
+    for target_currency in _RATES_TO_EUR
+}
 
 def get_fx_rate(currency: Optional[str], target_currency: Optional[str]) -> float:
     """Get the FX rate for a given currency and target currency."""
@@ -109,39 +284,39 @@ def get_fx_rate(currency: Optional[str], target_currency: Optional[str]) -> floa
     if not target_currency or not currency or currency == target_currency:
         return 1.0
 
-    rates_to_eur = {
-        "EUR": 1.0,
-        "USD": 1 / 1.1570,
-        "BRL": 1 / 6.1690,
-    }
-
-    if currency not in rates_to_eur or target_currency not in rates_to_eur:
-        raise ValueError(f"Unsupported currency conversion: {currency} -> {target_currency}")
-
-    value_in_eur = rates_to_eur[currency]
-    if target_currency == "EUR":
-        return value_in_eur
-    return value_in_eur / rates_to_eur[target_currency]
+    try:
+        return _FX[(currency, target_currency)]
+    except KeyError:
+        raise ValueError(f"Unsupported currency conversion: {currency} -> {target_currency}") from None
 
 def expenses_to_dataframe(expenses: List[Expense]) -> Any:
     """Transform a list of Expense objects into a pandas DataFrame."""
 
     pd = import_module("pandas")
 
-    dataframe = pd.json_normalize([expense.__dict__ for expense in expenses])
+    dataframe = pd.DataFrame(
+        {
+            field.name: [getattr(expense, field.name) for expense in expenses]
+            for field in fields(Expense)
+        }
+    )
+
+    return _present_dataframe(dataframe)
+
+def _present_dataframe(dataframe: Any) -> Any:
+    """Apply account ordering, column ordering and rounding for display."""
 
     accounts_path = Path(__file__).with_name("accounts.json")
     if accounts_path.exists() and "account_id" in dataframe.columns:
-        with accounts_path.open("r", encoding="utf-8") as fh:
-            accounts_data = json.load(fh)
+        accounts_data = _load_accounts(str(accounts_path))
         order_map = {
             account["id"]: index
             for index, account in enumerate(accounts_data.get("accounts", []))
             if account.get("id")
         }
         if order_map:
-            dataframe["__account_order"] = dataframe["account_id"].map(
-                lambda account_id: order_map.get(account_id, len(order_map))
+            dataframe["__account_order"] = (
+                dataframe["account_id"].map(order_map).fillna(len(order_map)).astype("int64")
             )
             dataframe = dataframe.sort_values(
                 by=["monthly_value_eur"],
@@ -166,13 +341,14 @@ def expenses_to_dataframe(expenses: List[Expense]) -> Any:
         column for column in dataframe.columns if column not in ordered_columns
     ]
 
-    for col in [
+    money_columns = [
         "yearly_value_eur",
         "monthly_value_eur",
         "yearly_value",
         "monthly_value",
-    ]:
-        if col in dataframe.columns:
-            dataframe[col] = dataframe[col].round(2)
+    ]
+    present = [column for column in money_columns if column in dataframe.columns]
+    if present:
+        dataframe[present] = dataframe[present].round(2)
 
     return dataframe.loc[:, ordered_columns + remaining_columns].reset_index(drop=True)